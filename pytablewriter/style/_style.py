@@ -276,6 +276,14 @@ class Style:
 
         return not self.__eq__(other)
 
+    def __copy__(self) -> "Style":
+        # faster than the default shallow copy via __reduce_ex__:
+        # writers copy styles for each of the cells
+        style = self.__class__.__new__(self.__class__)
+        style.__dict__.update(self.__dict__)
+
+        return style
+
     def update(self, **kwargs: Any) -> None:
         """Update specified style attributes."""
         self.__kwargs = kwargs
@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Final, Optional
 
 from dataproperty import Align
@@ -25,6 +26,18 @@ def get_align_char(align: Align) -> str:
     return _align_char_mapping[align]
 
 
+@lru_cache(maxsize=256)
+def _make_align_format(align: Align, padding: Optional[int]) -> str:
+    # format strings only depend on the align and the padding of a style:
+    # reuse them rather than building a format string for each cell
+    format_items = ["{:" + get_align_char(align)]
+    if padding is not None and padding > 0:
+        format_items.append(str(padding))
+    format_items.append("s}")
+
+    return "".join(format_items)
+
+
 def _to_latex_rgb(color: Color, value: str) -> str:
     return r"\textcolor{" + color.color_code + "}{" + value + "}"
 
@@ -78,17 +91,8 @@ class TextStyler(AbstractStyler):
 
         return tcolor(value, styles=ansi_styles)
 
-    def __get_align_format(self, style: Style) -> str:
-        align_char = get_align_char(style.align)
-        format_items = ["{:" + align_char]
-        if style.padding is not None and style.padding > 0:
-            format_items.append(str(style.padding))
-        format_items.append("s}")
-
-        return "".join(format_items)
-
     def apply_align(self, value: str, style: Style) -> str:
-        return self.__get_align_format(style).format(value)
+        return _make_align_format(style.align, style.padding).format(value)
 
     def apply(self, value: str, style: Style) -> str:
         if value:
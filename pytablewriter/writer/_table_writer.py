@@ -4,10 +4,10 @@
 
 import abc
 import copy
-import math
 import warnings
 from collections.abc import Sequence
-from typing import TYPE_CHECKING, Any, Optional, Union, cast
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Any, Final, Optional, Union, cast
 
 import typepy
 from dataproperty import (
@@ -47,7 +47,7 @@ if TYPE_CHECKING:
 
     from .._table_format import TableFormat
 
-_ts_to_flag: dict[ThousandSeparator, int] = {
+_ts_to_flag: Final[dict[ThousandSeparator, int]] = {
     ThousandSeparator.NONE: Format.NONE,
     ThousandSeparator.COMMA: Format.THOUSAND_SEPARATOR,
     ThousandSeparator.SPACE: Format.THOUSAND_SEPARATOR,
@@ -55,15 +55,45 @@ _ts_to_flag: dict[ThousandSeparator, int] = {
 }
 
 
+_HEADER_STYLE: Final[Style] = Style(align=Align.CENTER)
+
+
+@lru_cache(maxsize=64)
+def _extract_typehint_from_dtype_name(dtype_name: str) -> TypeHint:
+    # the type hint only depends on the name of a dtype:
+    # cache the results since DataFrames tend to have many columns with the same dtypes
+    return extract_typepy_from_dtype(dtype_name)
+
+
 def header_style_filter(cell: Cell, **kwargs: Any) -> Optional[Style]:
-    if cell.is_header_row():
-        return Style(align=Align.CENTER)
+    if cell.row == HEADER_ROW:
+        return _HEADER_STYLE
 
     return None
 
 
 DEFAULT_STYLE_FILTERS: list[StyleFilterFunc] = [header_style_filter]
 
+# typecodes of values in string columns that are aligned according to the values
+_VALUE_ALIGN_TYPECODES: Final[frozenset[Typecode]] = frozenset(
+    [Typecode.INTEGER, Typecode.REAL_NUMBER]
+)
+
+# dtype kinds of numeric arrays: boolean, signed/unsigned integer, and floating-point
+_NUMERIC_DTYPE_KINDS: Final[frozenset[str]] = frozenset("biuf")
+
+# fully qualified names of stream types that writers should not close
+_SKIP_CLOSE_STREAM_TYPES: Final[frozenset[str]] = frozenset(
+    [
+        # pytest
+        "_pytest.capture.CaptureIO",
+        "_pytest.capture.EncodedFile",
+        "_pytest.compat.CaptureIO",  # for pytest 5.4.1 or older versions
+        # Jupyter Notebook
+        "ipykernel.iostream.OutStream",
+    ]
+)
+
 
 class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
     """
@@ -161,10 +191,11 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
         self.__set_value_matrix(value_matrix)
         self.__clear_preprocess()
 
-    @property
+    @cached_property
     def table_format(self) -> "TableFormat":
         """TableFormat: Get the format of the writer."""
 
+        # imported here to avoid a circular import
         from .._table_format import TableFormat
 
         table_format = TableFormat.from_name(self.format_name)
@@ -187,6 +218,10 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
     def __init__(self, **kwargs: Any) -> None:
         self._logger = WriterLogger(self)
 
+        # skip clearing preprocessed data at each property setter during the initialization:
+        # the data will be cleared once at the end of the initialization
+        self.__is_suspend_clear_preprocess = True
+
         self.table_name = kwargs.get("table_name", "")
         self.value_matrix = kwargs.get("value_matrix", [])
 
@@ -236,13 +271,15 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
         )
         self._iter_count: Optional[int] = None
 
+        self.__col_style_list: list[Optional[Style]] = []
+
+        default_style = kwargs.get("default_style")
         self.__default_style: Style
-        self.default_style = kwargs.get("default_style", Style())
+        self.__set_default_style(Style() if default_style is None else default_style)
 
-        self.__col_style_list: list[Optional[Style]] = []
         self.column_styles = kwargs.get("column_styles", [])
 
-        self._style_filters: list[StyleFilterFunc] = copy.deepcopy(DEFAULT_STYLE_FILTERS)
+        self._style_filters: list[StyleFilterFunc] = list(DEFAULT_STYLE_FILTERS)
         self._enable_style_filter = True
         self._styler = self._create_styler(self)
         self.style_filter_kwargs: dict[str, Any] = kwargs.get("style_filter_kwargs", {})
@@ -255,6 +292,7 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
         if "dataframe" in kwargs:
             self.from_dataframe(kwargs["dataframe"])
 
+        self.__is_suspend_clear_preprocess = False
         self.__clear_preprocess()
 
     def _repr_html_(self) -> str:
@@ -282,11 +320,16 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
         self._is_complete_header_preprocess = False
         self._is_complete_value_matrix_preprocess = False
 
+        # headers may be changed between iterations of write_table_iter
+        self.__header_dp_list_cache: Optional[list[DataProperty]] = None
+
     def __clear_preprocess_data(self) -> None:
         self._column_dp_list: list[ColumnDataProperty] = []
         self._table_headers: list[str] = []
         self._table_value_matrix: list[Union[list[str], dict]] = []
         self._table_value_dp_matrix: Sequence[Sequence[DataProperty]] = []
+        self.__col_style_cache: list[Style] = []
+        self.__header_dp_list_cache = None
 
     @property
     def headers(self) -> Sequence[str]:
@@ -401,20 +444,10 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
         if style is None:
             style = Style()
 
-        if not isinstance(style, Style):
-            raise TypeError("default_style must be a Style instance")
-
-        try:
-            if self.__default_style == style:
-                return
-        except AttributeError:
-            # not yet initialized
-            pass
+        if self.__default_style == style:
+            return
 
-        self.__default_style = style
-        self._dp_extractor.default_format_flags = _ts_to_flag[
-            self.__default_style.thousand_separator
-        ]
+        self.__set_default_style(style)
         self.__clear_preprocess()
 
     @property
@@ -425,18 +458,22 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
 
     @column_styles.setter
     def column_styles(self, value: Sequence[Optional[Style]]) -> None:
-        if self.__col_style_list == value:
-            return
-
-        self.__col_style_list = list(value)
-
-        if self.__col_style_list:
-            self._dp_extractor.format_flags_list = [
-                _ts_to_flag[self._get_col_style(col_idx).thousand_separator]
-                for col_idx in range(len(self.__col_style_list))
+        if len(self.__col_style_list) == len(value):
+            # compare by identity: comparing each of the styles by value is costly for wide tables
+            changed_col_idxs = [
+                col_idx
+                for col_idx, (lhs, rhs) in enumerate(zip(self.__col_style_list, value))
+                if lhs is not rhs
             ]
+            if not changed_col_idxs:
+                return
+
+            self.__col_style_list = list(value)
+            for col_idx in changed_col_idxs:
+                self.__update_format_flags(col_idx)
         else:
-            self._dp_extractor.format_flags_list = []
+            self.__col_style_list = list(value)
+            self._dp_extractor.format_flags_list = self.__make_format_flags_list()
 
         self.__clear_preprocess()
 
@@ -513,7 +550,7 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
         if not self._style_filters:
             return
 
-        self._style_filters = copy.deepcopy(DEFAULT_STYLE_FILTERS)
+        self._style_filters = list(DEFAULT_STYLE_FILTERS)
         self._check_style_filter_kwargs_funcs = []
         self.__clear_preprocess()
 
@@ -574,10 +611,7 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
         if column_idx is not None:
             self.__col_style_list[column_idx] = style
             self.__clear_preprocess()
-            self._dp_extractor.format_flags_list = [
-                _ts_to_flag[self._get_col_style(col_idx).thousand_separator]
-                for col_idx in range(len(self.__col_style_list))
-            ]
+            self.__update_format_flags(column_idx)
             return
 
         raise ValueError(f"column must be an int or string: actual={column}")
@@ -612,42 +646,12 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
         self.style_filter_kwargs.update(**kwargs)
 
     def __is_skip_close(self) -> bool:
-        try:
-            from _pytest.capture import EncodedFile
-
-            if isinstance(self.stream, EncodedFile):
-                # avoid closing streams for pytest
-                return True
-        except ImportError:
-            pass
-
-        try:
-            from _pytest.capture import CaptureIO
-
-            if isinstance(self.stream, CaptureIO):
-                # avoid closing streams for pytest
-                return True
-        except ImportError:
-            try:
-                # for pytest 5.4.1 or older versions
-                from _pytest.compat import CaptureIO  # type: ignore
-
-                if isinstance(self.stream, CaptureIO):
-                    # avoid closing streams for pytest
-                    return True
-            except ImportError:
-                pass
-
-        try:
-            from ipykernel.iostream import OutStream
-
-            if isinstance(self.stream, OutStream):
-                # avoid closing streams for Jupyter Notebook
-                return True
-        except ImportError:
-            pass
-
-        return False
+        # compare type names instead of importing the modules to check with isinstance.
+        # base classes are checked as well to match subclasses of the types.
+        return any(
+            f"{stream_type.__module__}.{stream_type.__qualname__}" in _SKIP_CLOSE_STREAM_TYPES
+            for stream_type in type(self.stream).__mro__
+        )
 
     def close(self) -> None:
         """
@@ -696,13 +700,18 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
         :param tabledata.TableData value: Input table data.
         """
 
-        self.__clear_preprocess()
+        self.__is_suspend_clear_preprocess = True
+        try:
+            if is_overwrite_table_name:
+                self.table_name = value.table_name if value.table_name else ""
 
-        if is_overwrite_table_name:
-            self.table_name = value.table_name if value.table_name else ""
+            self.headers = value.headers
+            # avoid copying rows that are already a sequence
+            self.value_matrix = value.rows if isinstance(value.rows, Sequence) else list(value.rows)
+        finally:
+            self.__is_suspend_clear_preprocess = False
 
-        self.headers = value.headers
-        self.value_matrix = list(value.rows)
+        self.__clear_preprocess()
 
         if not value.has_value_dp_matrix:
             return
@@ -784,6 +793,8 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
             :ref:`example-from-pandas-dataframe`
         """
 
+        import numpy as np
+
         if isinstance(dataframe, str):
             import pandas as pd
 
@@ -794,16 +805,28 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
         self.headers = list(df.columns.values)
 
         if not self.type_hints or overwrite_type_hints:
-            self.type_hints = [extract_typepy_from_dtype(dtype) for dtype in df.dtypes]  # type: ignore
+            self.type_hints = [_extract_typehint_from_dtype_name(str(dtype)) for dtype in df.dtypes]
 
         if add_index_column:
             index_header = str(df.index.name) if df.index.name else " "
             self.headers = [index_header] + self.headers
             if self.type_hints:
                 self.type_hints = [Integer] + self.type_hints
-            self.value_matrix = [
-                [index] + list(row) for index, row in zip(df.index.tolist(), df.values.tolist())
-            ]
+
+            values = df.values
+            if values.dtype == object:
+                # columns with heterogeneous dtypes: the values are already Python objects,
+                # so prepend the index to each row with a single list allocation per row
+                self.value_matrix = [
+                    [index, *row] for index, row in zip(df.index.tolist(), values.tolist())
+                ]
+            else:
+                # build the matrix with a single object-dtype array to avoid a Python-level loop
+                # over rows and to prevent dtype promotion of the index by the values
+                self.value_matrix = np.concatenate(
+                    [df.index.to_numpy(dtype=object).reshape(-1, 1), values.astype(object)],
+                    axis=1,
+                ).tolist()
         else:
             self.value_matrix = df.values.tolist()
 
@@ -824,22 +847,24 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
                 Defaults to |True|.
         """
 
+        import numpy as np
+
         if series.name:
             self.headers = [str(series.name)]
         else:
             self.headers = ["value"]
 
-        self.type_hints = [extract_typepy_from_dtype(series.dtype)]
+        self.type_hints = [_extract_typehint_from_dtype_name(str(series.dtype))]
 
         if add_index_column:
             self.headers = [""] + self.headers
             if self.type_hints:
                 self.type_hints = [None] + self.type_hints
-            self.value_matrix = [
-                [index] + [value] for index, value in zip(series.index.tolist(), series.tolist())
-            ]
+            self.value_matrix = np.column_stack(
+                [series.index.to_numpy(dtype=object), series.to_numpy(dtype=object)]
+            ).tolist()
         else:
-            self.value_matrix = [[value] for value in series.tolist()]
+            self.value_matrix = series.to_numpy(dtype=object).reshape(-1, 1).tolist()
 
     def from_tablib(self, tablib_dataset: "tablib.Dataset") -> None:
         """
@@ -848,7 +873,7 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
 
         if tablib_dataset.headers:
             self.headers = tablib_dataset.headers
-        self.value_matrix = [row for row in tablib_dataset]
+        self.value_matrix = list(tablib_dataset)
 
     def from_writer(
         self, writer: "AbstractTableWriter", is_overwrite_table_name: bool = True
@@ -864,24 +889,32 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
                 Defaults to |True|.
         """
 
-        self.__clear_preprocess()
+        self.__is_suspend_clear_preprocess = True
+        try:
+            if is_overwrite_table_name:
+                self.table_name = str(writer.table_name)
 
-        if is_overwrite_table_name:
-            self.table_name = str(writer.table_name)
+            self.headers = writer.headers
 
-        self.headers = writer.headers
-        self.value_matrix = writer.value_matrix
+            # assign the attributes directly rather than via the property setters:
+            # comparisons with the current values are unnecessary in copying
+            self.__set_value_matrix(writer.value_matrix)
+            self.__set_type_hints(list(writer.type_hints))
+            self.__col_style_list = list(writer.column_styles)
+            self._dp_extractor.format_flags_list = self.__make_format_flags_list()
 
-        self.type_hints = writer.type_hints
-        self.column_styles = writer.column_styles
-        self._style_filters = writer._style_filters
-        self.style_filter_kwargs = writer.style_filter_kwargs
-        self.margin = writer.margin
+            self._style_filters = writer._style_filters
+            self.style_filter_kwargs = writer.style_filter_kwargs
+            self.margin = writer.margin
+        finally:
+            self.__is_suspend_clear_preprocess = False
 
         self._table_headers = writer._table_headers
         self._table_value_dp_matrix = writer._table_value_dp_matrix
         self._column_dp_list = writer._column_dp_list
         self._table_value_matrix = writer._table_value_matrix
+        self.__col_style_cache = []
+        self.__header_dp_list_cache = None
 
         self.stream = writer.stream
 
@@ -925,9 +958,7 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
         self._verify_table_name()
         self._verify_stream()
 
-        if all(
-            [typepy.is_empty_sequence(self.headers), typepy.is_empty_sequence(self.value_matrix)]
-        ):
+        if typepy.is_empty_sequence(self.headers) and typepy.is_empty_sequence(self.value_matrix):
             self._logger.logger.debug("no tabular data found")
             return
 
@@ -944,9 +975,7 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
             self._iter_count = 1
 
             for work_matrix in self.value_matrix:
-                is_final_iter = all(
-                    [self.iteration_length > 0, self._iter_count >= self.iteration_length]
-                )
+                is_final_iter = 0 < self.iteration_length <= self._iter_count
 
                 if is_final_iter:
                     self.is_write_closing_row = True
@@ -954,12 +983,20 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
                 self.__set_value_matrix(work_matrix)
                 self.__clear_preprocess_status()
 
+                # headers are written only at the first iteration:
+                # skip preprocessing the headers again for the following iterations
+                self._is_complete_header_preprocess = self._iter_count > 1
+
+                self._begin_iteration()
+
                 with self._logger:
                     self._write_table(**kwargs)
 
                     if not is_final_iter:
                         self._write_value_row_separator()
 
+                self._end_iteration()
+
                 self.is_write_opening_row = False
                 self.is_write_header = False
 
@@ -1021,32 +1058,50 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
             self._styler.apply(col_dp.dp_to_str(value_dp), style=style), style=style
         )
 
+    def _begin_iteration(self) -> None:
+        pass
+
+    def _end_iteration(self) -> None:
+        pass
+
     def _fetch_style_from_filter(
         self, row_idx: int, col_dp: ColumnDataProperty, value_dp: DataProperty, default_style: Style
     ) -> Style:
         if not self._enable_style_filter:
             return default_style
 
-        self.style_filter_kwargs.update({"writer": self})
+        style_filter_kwargs = self.style_filter_kwargs
+        if style_filter_kwargs.get("writer") is not self:
+            style_filter_kwargs["writer"] = self
 
         style: Optional[Style] = None
-        for style_filter in self._style_filters:
-            style = style_filter(
-                Cell(
-                    row=row_idx,
-                    col=col_dp.column_index,
-                    value=value_dp.data,
-                    default_style=default_style,
-                ),
-                **self.style_filter_kwargs,
+        style_filters = self._style_filters
+        if style_filters:
+            # Cell is immutable: share an instance among the filters for the cell
+            cell = Cell(
+                row=row_idx,
+                col=col_dp.column_index,
+                value=value_dp.data,
+                default_style=default_style,
             )
-            if style:
-                break
+
+            for style_filter in style_filters:
+                style = style_filter(cell, **style_filter_kwargs)
+                if style:
+                    break
 
         if style is None:
-            style = copy.deepcopy(default_style)
+            style = default_style
+
+        is_retrieve_align = style.align is None or (style.align == Align.AUTO and row_idx >= 0)
+        if not is_retrieve_align and style.padding is not None:
+            return style
+
+        # styles are shared between cells (e.g. column styles): complete a copy of the style.
+        # a shallow copy suffices since only the align and the padding are replaced.
+        style = copy.copy(style)
 
-        if style.align is None or (style.align == Align.AUTO and row_idx >= 0):
+        if is_retrieve_align:
             style.align = self.__retrieve_align_from_data(col_dp, value_dp)
 
         if style.padding is None:
@@ -1055,11 +1110,9 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
         return style
 
     def _get_col_style(self, col_idx: int) -> Style:
-        try:
-            style = self.column_styles[col_idx]
-        except (TypeError, IndexError, KeyError):
-            pass
-        else:
+        col_styles = self.__col_style_list
+        if isinstance(col_idx, int) and -len(col_styles) <= col_idx < len(col_styles):
+            style = col_styles[col_idx]
             if style:
                 return style
 
@@ -1079,10 +1132,12 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
     def __retrieve_align_from_data(
         self, col_dp: ColumnDataProperty, value_dp: DataProperty
     ) -> Align:
-        if col_dp.typecode == Typecode.STRING and (
-            value_dp.typecode in (Typecode.INTEGER, Typecode.REAL_NUMBER)
-            or value_dp.typecode == Typecode.STRING
-            and value_dp.is_include_ansi_escape
+        if col_dp.typecode != Typecode.STRING:
+            return col_dp.align
+
+        value_typecode = value_dp.typecode
+        if value_typecode in _VALUE_ALIGN_TYPECODES or (
+            value_typecode == Typecode.STRING and value_dp.is_include_ansi_escape
         ):
             return value_dp.align
 
@@ -1093,12 +1148,12 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
         self._verify_table_name()
         self._verify_stream()
 
-        if all(
-            [
-                typepy.is_empty_sequence(self.headers),
-                typepy.is_empty_sequence(self.value_matrix),
-                typepy.is_empty_sequence(self._table_value_dp_matrix),
-            ]
+        # headers and value_matrix are user inputs that may be arrays (e.g. numpy.ndarray)
+        # that can not be evaluated as a bool, unlike the preprocessed list
+        if (
+            typepy.is_empty_sequence(self.headers)
+            and typepy.is_empty_sequence(self.value_matrix)
+            and not self._table_value_dp_matrix
         ):
             raise EmptyTableDataError()
 
@@ -1109,17 +1164,57 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
             pass
 
     def __set_value_matrix(self, value_matrix: Sequence) -> None:
+        if getattr(getattr(value_matrix, "dtype", None), "kind", None) in _NUMERIC_DTYPE_KINDS:
+            # numeric arrays (e.g. numpy.ndarray): convert to nested lists of Python numbers
+            # at once rather than processing the array element scalars one by one
+            value_matrix = value_matrix.tolist()  # type: ignore
+
         self.__value_matrix_org = value_matrix
 
     def __set_type_hints(self, type_hints: Sequence[Union[str, TypeHint]]) -> None:
         self._dp_extractor.column_type_hints = type_hints
 
+    def __set_default_style(self, style: Style) -> None:
+        if not isinstance(style, Style):
+            raise TypeError("default_style must be a Style instance")
+
+        self.__default_style = style
+        self._dp_extractor.default_format_flags = _ts_to_flag[style.thousand_separator]
+        if self.__col_style_list:
+            # columns without a style follow the default style
+            self._dp_extractor.format_flags_list = self.__make_format_flags_list()
+
+    def __make_format_flags_list(self) -> list[int]:
+        ts_to_flag = _ts_to_flag  # local variable lookups are faster than global lookups
+        default_flag = ts_to_flag[self.__default_style.thousand_separator]
+
+        return [
+            ts_to_flag[style.thousand_separator] if style else default_flag
+            for style in self.__col_style_list
+        ]
+
+    def __update_format_flags(self, col_idx: int) -> None:
+        # update only the flag of the column that changed instead of recomputing all of them.
+        # the list is modified in place without passing it to the setter of the extractor:
+        # the extractor reads the flag of each column when extracting data properties,
+        # and the cache that the setter clears does not depend on the flags of the columns.
+        flags = self._dp_extractor.format_flags_list
+        if not isinstance(flags, list):
+            flags = list(flags)
+            self._dp_extractor.format_flags_list = flags
+
+        if len(flags) < len(self.__col_style_list):
+            default_flag = _ts_to_flag[self.__default_style.thousand_separator]
+            flags.extend([default_flag] * (len(self.__col_style_list) - len(flags)))
+
+        flags[col_idx] = _ts_to_flag[self._get_col_style(col_idx).thousand_separator]
+
     def _verify_style_filter_kwargs(self) -> None:
         for checker in self._check_style_filter_kwargs_funcs:
             checker(**self.style_filter_kwargs)
 
     def _verify_table_name(self) -> None:
-        if all([self._is_require_table_name, typepy.is_null_string(self.table_name)]):
+        if self._is_require_table_name and typepy.is_null_string(self.table_name):
             raise EmptyTableNameError(
                 "table_name must be a string, with at least one or more character."
             )
@@ -1177,9 +1272,26 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
         self._is_complete_table_dp_preprocess = True
 
     def _fetch_style(self, row: int, col_dp: ColumnDataProperty, value_dp: DataProperty) -> Style:
-        default_style = self._get_col_style(col_dp.column_index)
+        default_style = self.__get_col_styles()[col_dp.column_index]
         return self._fetch_style_from_filter(row, col_dp, value_dp, default_style)
 
+    def __get_col_styles(self) -> list[Style]:
+        # resolve styles for each column once per table rather than for each cell
+        if len(self.__col_style_cache) != len(self._column_dp_list):
+            self.__col_style_cache = [
+                self._get_col_style(col_idx) for col_idx in range(len(self._column_dp_list))
+            ]
+
+        return self.__col_style_cache
+
+    def _get_header_dp_list(self) -> list[DataProperty]:
+        # headers are converted to data properties once per table:
+        # the preprocess stages and subclasses share the same list
+        if self.__header_dp_list_cache is None:
+            self.__header_dp_list_cache = self._dp_extractor.to_header_dp_list()
+
+        return self.__header_dp_list_cache
+
     def _preprocess_table_property(self) -> None:
         if self._is_complete_table_property_preprocess:
             return
@@ -1188,17 +1300,17 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
 
         if self._iter_count == 1:
             for column_dp in self._column_dp_list:
-                column_dp.extend_width(int(math.ceil(column_dp.ascii_char_width * 0.25)))
+                # extend by a quarter of the width (rounded up)
+                column_dp.extend_width((column_dp.ascii_char_width + 3) // 4)
 
-        header_dp_list = self._dp_extractor.to_header_dp_list()
+        header_dp_list = self._get_header_dp_list()
         if not header_dp_list:
             return
 
-        for column_dp in self._column_dp_list:
-            style = self._get_col_style(column_dp.column_index)
-            header_style = self._fetch_style(
-                HEADER_ROW, column_dp, header_dp_list[column_dp.column_index]
-            )
+        col_styles = self.__get_col_styles()
+        for column_dp, header_dp in zip(self._column_dp_list, header_dp_list):
+            style = col_styles[column_dp.column_index]
+            header_style = self._fetch_style(HEADER_ROW, column_dp, header_dp)
             body_width = self._styler.get_additional_char_width(style)
             header_width = self._styler.get_additional_char_width(header_style)
             column_dp.extend_body_width(max(body_width, header_width))
@@ -1211,11 +1323,10 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
 
         self._logger.logger.debug("_preprocess_header")
 
+        to_header_item = self._to_header_item
         self._table_headers = [
-            self._to_header_item(col_dp, header_dp)
-            for col_dp, header_dp in zip(
-                self._column_dp_list, self._dp_extractor.to_header_dp_list()
-            )
+            to_header_item(col_dp, header_dp)
+            for col_dp, header_dp in zip(self._column_dp_list, self._get_header_dp_list())
         ]
 
         self._is_complete_header_preprocess = True
@@ -1228,16 +1339,44 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
             f"_preprocess_value_matrix: value-rows={len(self._table_value_dp_matrix)}"
         )
 
-        self._table_value_matrix = [
-            [
-                self._to_row_item(row_idx, col_dp, value_dp)
-                for col_dp, value_dp in zip(self._column_dp_list, value_dp_list)
+        if self.__is_unstyled_row_item():
+            # styles have no effect on the cells: format each column at once with
+            # the column formatter instead of resolving a style for each cell
+            value_cols = [
+                list(map(col_dp.dp_to_str, value_dps))
+                for col_dp, value_dps in zip(
+                    self._column_dp_list, zip(*self._table_value_dp_matrix)
+                )
+            ]
+            self._table_value_matrix = [list(values) for values in zip(*value_cols)]
+        else:
+            # bind to local variables: attribute lookups are repeated for each of the cells
+            to_row_item = self._to_row_item
+            column_dp_list = self._column_dp_list
+            self._table_value_matrix = [
+                [
+                    to_row_item(row_idx, col_dp, value_dp)
+                    for col_dp, value_dp in zip(column_dp_list, value_dp_list)
+                ]
+                for row_idx, value_dp_list in enumerate(self._table_value_dp_matrix)
             ]
-            for row_idx, value_dp_list in enumerate(self._table_value_dp_matrix)
-        ]
 
         self._is_complete_value_matrix_preprocess = True
 
+    def __is_unstyled_row_item(self) -> bool:
+        from ..style._styler import NullStyler
+
+        if type(self._styler) is not NullStyler:
+            return False
+
+        # the row item methods may be overridden by subclasses or replaced at instances
+        writer_class = type(self)
+        return all(
+            method_name not in self.__dict__
+            and getattr(writer_class, method_name) is getattr(AbstractTableWriter, method_name)
+            for method_name in ("_to_row_item", "_apply_style_to_row_item")
+        )
+
     def _preprocess(self) -> None:
         self._preprocess_table_dp()
         self._preprocess_table_property()
@@ -1248,5 +1387,8 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
         self.__clear_preprocess()
 
     def __clear_preprocess(self) -> None:
+        if self.__is_suspend_clear_preprocess:
+            return
+
         self.__clear_preprocess_status()
         self.__clear_preprocess_data()
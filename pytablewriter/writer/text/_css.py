@@ -96,7 +96,7 @@ class CssTableWriter(IndentationTextTableWriter):
         return f"text-align: {value}"
 
     def __write_css_thead(self, css_class: str, base_indent_level: int) -> None:
-        for col_dp, header_dp in zip(self._column_dp_list, self._dp_extractor.to_header_dp_list()):
+        for col_dp, header_dp in zip(self._column_dp_list, self._get_header_dp_list()):
             style = self._fetch_style(HEADER_ROW, col_dp, header_dp)
             css_tags = self.__extract_css_tags(header_dp, style)
 
@@ -100,6 +100,16 @@ class TextTableWriter(AbstractTableWriter, TextWriterInterface):
 
         Write a blank line of after writing a table if the value is |True|.
 
+    .. py:attribute:: iteration_buffer_size
+        :type: int
+        :value: 0
+
+        Number of characters to buffer before writing outputs to the stream
+        in :py:meth:`.write_table_iter`.
+        Outputs are written to the stream at each iteration if the value is ``0`` or less.
+        Larger values reduce write calls to the stream,
+        whereas outputs may be written after calls of the ``write_callback``.
+
     .. py:attribute:: margin
         :type: int
 
@@ -122,6 +132,8 @@ class TextTableWriter(AbstractTableWriter, TextWriterInterface):
         super().__init__(**kwargs)
 
         self.stream = sys.stdout
+        self.__iteration_stream: Optional[IO[str]] = None
+        self.__iteration_buffer: Optional[io.StringIO] = None
 
         self._set_chars("")
 
@@ -142,6 +154,7 @@ class TextTableWriter(AbstractTableWriter, TextWriterInterface):
 
         self._dp_extractor.preprocessor.line_break_handling = LineBreakHandling.REPLACE
         self.is_write_null_line_after_table = kwargs.get("is_write_null_line_after_table", False)
+        self.iteration_buffer_size = kwargs.get("iteration_buffer_size", 0)
 
         self._init_cross_point_maps()
 
@@ -168,6 +181,17 @@ class TextTableWriter(AbstractTableWriter, TextWriterInterface):
         self._margin = value
         self._clear_preprocess()
 
+    @property
+    def iteration_buffer_size(self) -> int:
+        return self.__iteration_buffer_size
+
+    @iteration_buffer_size.setter
+    def iteration_buffer_size(self, value: int) -> None:
+        if not isinstance(value, int):
+            raise TypeError(f"iteration_buffer_size must be an integer: actual={type(value)}")
+
+        self.__iteration_buffer_size = value
+
     def _init_cross_point_maps(self) -> None:
         self.__cross_point_maps = {
             RowType.OPENING: self.char_opening_row_cross_point,
@@ -343,10 +367,57 @@ class TextTableWriter(AbstractTableWriter, TextWriterInterface):
         return TextStyler(writer)
 
     def _write_table_iter(self, **kwargs: Any) -> None:
-        super()._write_table_iter()
+        try:
+            super()._write_table_iter()
+        finally:
+            if self.__iteration_stream is not None:
+                # restore the stream when an iteration was interrupted
+                self.stream = self.__iteration_stream
+                self.__iteration_stream = None
+
+            try:
+                self.__write_iteration_buffer()
+            finally:
+                if self.__iteration_buffer is not None:
+                    self.__iteration_buffer.close()
+                    self.__iteration_buffer = None
+
         if self.is_write_null_line_after_table:
             self.write_null_line()
 
+    def _begin_iteration(self) -> None:
+        # buffer outputs of iterations and write them to the stream at once,
+        # rather than writing each of the rows to the stream
+        if self.__iteration_buffer is None:
+            self.__iteration_buffer = io.StringIO()
+
+        self.__iteration_stream = self.stream
+        self.stream = self.__iteration_buffer
+
+    def _end_iteration(self) -> None:
+        # the stream is restored before the write_callback is called
+        self.stream = cast(IO[str], self.__iteration_stream)
+        self.__iteration_stream = None
+
+        buffer = cast(io.StringIO, self.__iteration_buffer)
+        if buffer.tell() < self.iteration_buffer_size:
+            return
+
+        self.__write_iteration_buffer()
+
+    def __write_iteration_buffer(self) -> None:
+        buffer = self.__iteration_buffer
+        if buffer is None:
+            return
+
+        text = buffer.getvalue()
+        if not text:
+            return
+
+        self.stream.write(text)
+        buffer.seek(0)
+        buffer.truncate(0)
+
     def _write_table(self, **kwargs: Any) -> None:
         self._preprocess()
         self._write_opening_row()
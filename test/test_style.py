@@ -253,3 +253,28 @@ class Test_Style_update:
         assert lhs.color == lhs.fg_color
         assert rhs.color == rhs.fg_color
         assert lhs.bg_color == rhs.bg_color
+
+
+class Test_Style_copy:
+    def test_normal(self):
+        lhs = Style(
+            align="left",
+            padding=1,
+            vertical_align="bottom",
+            fg_color="red",
+            bg_color="#2f2f2f",
+            decoration_line="line-through",
+            font_size="tiny",
+            font_style="italic",
+            font_weight="bold",
+            thousand_separator=",",
+        )
+        rhs = copy.copy(lhs)
+        assert rhs is not lhs
+        assert rhs == lhs
+        assert repr(rhs) == repr(lhs)
+
+        rhs.align = Align.RIGHT
+        rhs.padding = 2
+        assert lhs.align == Align.LEFT
+        assert lhs.padding == 1
@@ -263,3 +263,16 @@ class Test_SqliteTableWriter_dumps:
 
         with pytest.raises(NotImplementedError):
             writer.dumps()
+
+
+class Test_SqliteTableWriter_preprocess:
+    def test_normal_instance_to_row_item(self):
+        writer = ptw.SqliteTableWriter()
+        writer.table_name = "tablename"
+        writer.headers = ["a", "b"]
+        writer.value_matrix = [[1, "x"], [2, "y"]]
+
+        writer._to_row_item = lambda row_idx, col_dp, value_dp: col_dp.dp_to_str(value_dp) * 2
+        writer._preprocess()
+
+        assert writer._table_value_matrix == [["11", "xx"], ["22", "yy"]]
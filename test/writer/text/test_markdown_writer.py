@@ -642,6 +642,18 @@ class Test_MarkdownTableWriter_write_table:
 
         assert out == expected
 
+    @pytest.mark.skipif(SKIP_DATAFRAME_TEST, reason="required package not found")
+    def test_normal_numpy_array(self):
+        import numpy as np
+
+        value_matrix = [[1.0, 2.25], [-30.0, 4.5]]
+        writer = table_writer_class(headers=["a", "b"], value_matrix=value_matrix)
+        expected = writer.dumps()
+
+        writer.value_matrix = np.array(value_matrix)
+        assert writer.value_matrix == value_matrix
+        assert writer.dumps() == expected
+
     def test_normal_type_hints(self):
         writer = table_writer_class(
             table_name="type hints",
@@ -1041,6 +1053,26 @@ class Test_MarkdownTableWriter_write_table:
         print_test_result(expected=expected, actual=output)
         assert strip_ansi_escape(output) == expected
 
+    def test_normal_set_style_with_default_style(self):
+        writer = table_writer_class(
+            headers=["a", "b", "c"],
+            value_matrix=[[1234, 1234, 1234]],
+            margin=1,
+        )
+
+        writer.set_style(1, Style(thousand_separator="_"))
+        writer.default_style = Style(thousand_separator=",")
+        expected = dedent(
+            """\
+            |   a   |   b   |   c   |
+            | ----: | ----: | ----: |
+            | 1,234 | 1_234 | 1,234 |
+            """
+        )
+        output = writer.dumps()
+        print_test_result(expected=expected, actual=output)
+        assert output == expected
+
     def test_normal_ansi_color(self, capsys):
         writer = table_writer_class()
         writer.table_name = "ANCI escape sequence"
@@ -1638,6 +1670,15 @@ class Test_MarkdownTableWriter_from_dataframe:
         print_test_result(expected=expected, actual=out)
         assert out == expected
 
+    def test_normal_numeric_index(self):
+        writer = table_writer_class()
+        df = pd.DataFrame({"A": [1.5, 2.5], "B": ["x", "y"]}, index=[10, 20])
+
+        writer.from_dataframe(df, add_index_column=True)
+
+        assert writer.value_matrix == [[10, 1.5, "x"], [20, 2.5, "y"]]
+        assert [type(value) for value in writer.value_matrix[0]] == [int, float, str]
+
     def test_normal_overwrite_type_hints(self):
         writer = table_writer_class(table_name="overwrite_type_hints", type_hints=[Integer])
         df = pd.DataFrame({"A": [1.1, 2.2], "B": [10.1, 11.2]}, index=["a", "b"])
@@ -1,6 +1,10 @@
+import io
+import sys
 from typing import Optional
 
-from pytablewriter import TableWriterFactory
+import pytest
+
+from pytablewriter import NotSupportedError, TableWriterFactory
 from pytablewriter.style import Cell, Style
 
 
@@ -41,3 +45,269 @@ class Test_text_writer:
         writer.enable_style_filter()
         output_wo_filter_2 = writer.dumps()
         assert output_w_filter == output_wo_filter_2
+
+    def test_normal_close(self, capsys):
+        writer = TableWriterFactory.create_from_format_name(format_name="markdown")
+
+        # streams of pytest are not closed
+        writer.stream = sys.stdout
+        writer.close()
+        assert not sys.stdout.closed
+
+        stream = io.StringIO()
+        writer.stream = stream
+        writer.close()
+        assert stream.closed
+        assert writer.stream is None
+
+    def test_normal_style_filter_shared_style(self):
+        shared_style = Style(font_weight="bold")
+
+        def style_filter(cell: Cell, **kwargs) -> Optional[Style]:
+            return shared_style
+
+        writer = TableWriterFactory.create_from_format_name(
+            format_name="markdown",
+            headers=["A", "B"],
+            value_matrix=[[1, "abc"], [22, "d"]],
+        )
+        writer.add_style_filter(style_filter)
+        writer.dumps()
+
+        assert shared_style == Style(font_weight="bold")
+        assert shared_style.padding is None
+
+    def test_normal_column_styles_unchanged(self):
+        writer = TableWriterFactory.create_from_format_name(
+            format_name="markdown",
+            headers=["A", "B"],
+            value_matrix=[[1, "abc"], [22, "d"]],
+            column_styles=[Style(font_weight="bold"), None],
+        )
+        writer.dumps()
+
+        assert writer.column_styles[0] == Style(font_weight="bold")
+        assert writer.column_styles[0].padding is None
+        assert writer.default_style == Style()
+        assert writer.default_style.padding is None
+
+    def test_normal_write_table_iter_stream(self):
+        stream = io.StringIO()
+        written_lengths = []
+        callback_streams = []
+
+        def write_callback(iter_count: int, iter_length: int) -> None:
+            written_lengths.append(len(stream.getvalue()))
+            callback_streams.append(writer.stream)
+
+        writer = TableWriterFactory.create_from_format_name(
+            format_name="markdown",
+            headers=["A", "B"],
+            value_matrix=[[[1, "abc"], [22, "d"]], [[333, "ef"]]],
+            iteration_length=2,
+            write_callback=write_callback,
+        )
+        writer.stream = stream
+        writer.write_table_iter()
+
+        assert len(written_lengths) == 2
+        assert 0 < written_lengths[0] < written_lengths[1]
+        assert written_lengths[1] <= len(stream.getvalue())
+        assert callback_streams == [stream, stream]
+        assert writer.stream is stream
+
+    def test_normal_write_table_iter_buffer_size(self):
+        outputs = []
+
+        for iteration_buffer_size in (0, 1024):
+            stream = io.StringIO()
+            written_lengths = []
+
+            writer = TableWriterFactory.create_from_format_name(
+                format_name="markdown",
+                headers=["A", "B"],
+                value_matrix=[[[1, "abc"], [22, "d"]], [[333, "ef"]]],
+                iteration_length=2,
+                iteration_buffer_size=iteration_buffer_size,
+                write_callback=lambda iter_count, iter_length: written_lengths.append(
+                    len(stream.getvalue())
+                ),
+            )
+            writer.stream = stream
+            writer.write_table_iter()
+
+            if iteration_buffer_size > 0:
+                assert written_lengths == [0, 0]
+            assert writer.stream is stream
+            outputs.append(stream.getvalue())
+
+        assert outputs[0]
+        assert outputs[0] == outputs[1]
+
+    def test_normal_write_table_iter_header_preprocess(self):
+        writer = TableWriterFactory.create_from_format_name(
+            format_name="markdown",
+            headers=["A", "B"],
+            value_matrix=[[[1, "abc"], [22, "d"]], [[333, "ef"]], [[4444, "g"]]],
+            iteration_length=3,
+        )
+        writer.stream = io.StringIO()
+        writer.write_table_iter()
+
+        assert writer.stream.getvalue().splitlines() == [
+            "| A  | B  |",
+            "|---:|----|",
+            "|   1|abc |",
+            "|  22|d   |",
+            "| 333|ef  |",
+            "|4444|g   |",
+        ]
+
+    def test_normal_dumps_reuse_preprocessed_data(self):
+        writer = TableWriterFactory.create_from_format_name(
+            format_name="markdown",
+            headers=["A", "B"],
+            value_matrix=[[1, "abc"], [22, "d"]],
+        )
+        output = writer.dumps()
+
+        assert writer.dumps() == output
+
+        writer.column_styles = [Style(align="left"), None]
+        assert writer.dumps().splitlines() == [
+            "| A | B |",
+            "|---|---|",
+            "|1  |abc|",
+            "|22 |d  |",
+        ]
+
+        writer.column_styles = [None, None]
+        assert writer.dumps() == output
+
+    def test_normal_write_table_iter_change_headers(self):
+        stream = io.StringIO()
+        writer = TableWriterFactory.create_from_format_name(
+            format_name="markdown",
+            headers=["A", "B"],
+            value_matrix=[[[1, "abc"]], [[22, "d"]]],
+            iteration_length=2,
+        )
+        writer.dumps()
+
+        writer.headers = ["X", "Y"]
+        writer.stream = stream
+        writer.write_table_iter()
+
+        header_row = stream.getvalue().splitlines()[0]
+        assert [header.strip() for header in header_row.split("|")[1:-1]] == ["X", "Y"]
+
+    def test_exception_write_table_iter_stream(self):
+        writer = TableWriterFactory.create_from_format_name(
+            format_name="markdown",
+            headers=["A", "B"],
+            value_matrix=[[[1, "abc"], [22, "d"]], [[333, "ef"]]],
+            iteration_length=1,
+        )
+        writer.stream = None
+
+        with pytest.raises(OSError):
+            writer.write_table_iter()
+        assert writer.stream is None
+
+        class BrokenStream(io.StringIO):
+            def write(self, text):
+                raise OSError("broken stream")
+
+        stream = BrokenStream()
+        writer.stream = stream
+
+        with pytest.raises(OSError):
+            writer.write_table_iter()
+        assert writer.stream is stream
+
+    def test_exception_write_table_iter_not_supported(self):
+        writer = TableWriterFactory.create_from_format_name(
+            format_name="html", headers=["A", "B"], value_matrix=[[[1, "abc"]]]
+        )
+        writer.stream = None
+
+        with pytest.raises(NotSupportedError):
+            writer.write_table_iter()
+        assert writer.stream is None
+
+    @pytest.mark.parametrize(["value"], [[None], ["1024"], [1.5]])
+    def test_exception_iteration_buffer_size(self, value):
+        with pytest.raises(TypeError):
+            TableWriterFactory.create_from_format_name(
+                format_name="markdown", iteration_buffer_size=value
+            )
+
+        writer = TableWriterFactory.create_from_format_name(format_name="markdown")
+        with pytest.raises(TypeError):
+            writer.iteration_buffer_size = value
+        assert writer.iteration_buffer_size == 0
+
+    def test_normal_from_writer_rendered(self):
+        src_writer = TableWriterFactory.create_from_format_name(
+            format_name="markdown",
+            headers=["A", "B"],
+            value_matrix=[[1, "abc"], [22, "d"]],
+        )
+        src_writer.dumps()
+
+        writer = TableWriterFactory.create_from_format_name(format_name="rst_grid_table")
+        writer.from_writer(src_writer)
+        lines = [line.strip() for line in writer.dumps().splitlines()]
+
+        assert lines == [
+            ".. table::",
+            "",
+            "+---+---+",
+            "| A | B |",
+            "+===+===+",
+            "|  1|abc|",
+            "+---+---+",
+            "| 22|d  |",
+            "+---+---+",
+        ]
+
+    def test_normal_change_chars_after_dumps(self):
+        writer = TableWriterFactory.create_from_format_name(
+            format_name="rst_grid_table",
+            headers=["A", "B"],
+            value_matrix=[[1, "abc"], [22, "d"]],
+        )
+        assert writer.dumps().splitlines()[2].strip() == "+--+---+"
+
+        writer.char_top_left_cross_point = "#"
+        assert writer.dumps().splitlines()[2].strip() == "#--+---+"
+
+    def test_normal_column_styles_update_thousand_separator(self):
+        writer = TableWriterFactory.create_from_format_name(
+            format_name="markdown",
+            headers=["A", "B"],
+            value_matrix=[[1234, 5678]],
+            column_styles=[None, None],
+            margin=1,
+        )
+        assert "1234" in writer.dumps()
+
+        writer.column_styles = [None, Style(thousand_separator=",")]
+        output = writer.dumps()
+        assert "1234" in output
+        assert "5,678" in output
+
+        writer.set_style(0, Style(thousand_separator=","))
+        output = writer.dumps()
+        assert "1,234" in output
+        assert "5,678" in output
+
+    @pytest.mark.parametrize(["col_idx"], [[-3], [2], [100], [None], ["0"]])
+    def test_normal_get_col_style_out_of_range(self, col_idx):
+        writer = TableWriterFactory.create_from_format_name(
+            format_name="markdown",
+            column_styles=[Style(font_weight="bold"), None],
+        )
+
+        assert writer._get_col_style(col_idx) is writer.default_style
+        assert writer._get_col_style(-2) == Style(font_weight="bold")